@@ -1,6 +1,7 @@
 import datetime as dt
 import re
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Union
 from numpy import exp
 
@@ -30,9 +31,35 @@ DATETIME_FORMATS = OrderedDict([
     ('%Y%m%d%H%M', re.compile(r'^(?P<year>[0-9]{4})(?P<month>1[0-2]|0[1-9])(?P<day>3[01]|0[1-9]|[12][0-9])(?P<hour>2[0-3]|[01][0-9])(?P<minute>[0-5][0-9])$'))
 ])
 
+DATETIME_DIMENSIONS = {
+    'ga:yearMonth': '%Y%m',
+    'ga:date': '%Y%m%d',
+    'ga:dateHour': '%Y%m%d%H',
+    'ga:dateHourMinute': '%Y%m%d%H%M'
+}
+
 YYYY_MM_DD = re.compile(r'^(?P<year>[0-9]{4})-(?P<month>1[0-2]|0[1-9])-(?P<day>3[01]|0[1-9]|[12][0-9])$')
 
 
+N_DAYS_AGO = re.compile(r'^[0-9]+DaysAgo$')
+
+DATE_LITERALS = frozenset(['yesterday', 'today'])
+
+
+@lru_cache(maxsize=256)
+def _parse_date_str(value):
+    if value in DATE_LITERALS:
+        return value
+    elif YYYY_MM_DD.match(value):
+        return value
+    elif N_DAYS_AGO.match(value):
+        return value
+    else:
+        raise ValueError(f'{value} is not a supported date.\n'
+                         f'Please use a date/datetime object or string of the following formats:\n'
+                         f'"yesterday", "today", "NDaysAgo", "YYYY-MM-DD"')
+
+
 class GoogleAnalyticsQuerySource(DataSource):
     """
     Run a Google Analytics (Universal Analytics) query and return a Data Frame
@@ -157,23 +184,24 @@ class GoogleAnalyticsAPI(object):
         if expected_rows == 0:
             return report
 
+        rows = list(report['data']['rows'])
         while result['reports'][0].get('nextPageToken'):
             body['reportRequests'][0]['pageToken'] = result['reports'][0].get('nextPageToken')
             result = self.client.batchGet(body=body).execute()
-            report['data']['rows'].extend(result['reports'][0]['data']['rows'])
+            rows.extend(result['reports'][0]['data']['rows'])
 
-        gathered_rows = len(report['data']['rows'])
+        gathered_rows = len(rows)
         if gathered_rows != expected_rows:
             raise RuntimeError(f'The query was expected to return {expected_rows} rows, '
                                f'but {gathered_rows} rows were retrieved.')
 
-        return report
+        return {**report, 'data': {**report['data'], 'rows': rows}}
 
     @staticmethod
     def _to_dataframe(report, parse_dates=True):
         headers = report['columnHeader']
 
-        columns = headers.get('dimensions', [])
+        columns = list(headers.get('dimensions', []))
         metric_columns = headers['metricHeader']['metricHeaderEntries']
 
         dtypes = {}
@@ -182,30 +210,28 @@ class GoogleAnalyticsAPI(object):
             columns.append(name)
             dtypes[name] = DTYPES[c['type']]
 
-        data = []
-        rows = report['data'].get('rows', [])
-        for row in rows:
-
-            dim_values = row.get('dimensions', [])
-
-            this_row = []
-            metric_values = row.get('metrics', [{'values': [0] * len(metric_columns)}])[0]['values']
-
-            this_row.extend(dim_values)
-            this_row.extend(metric_values)
+        rows = report['data'].get('rows')
+        if not rows:
+            return pd.DataFrame(columns=columns).astype(dtypes)
 
-            data.append(this_row)
+        empty_metrics = [{'values': [0] * len(metric_columns)}]
+        data = [
+            tuple(row.get('dimensions', [])) + tuple(row.get('metrics', empty_metrics)[0]['values'])
+            for row in rows
+        ]
 
-        df = pd.DataFrame(data=data, columns=columns)
+        df = pd.DataFrame.from_records(data, columns=columns)
         for c, dtype in dtypes.items():
-            df[c] = df[c].astype(dtype)
+            df[c] = pd.to_numeric(df[c]).astype(dtype)
 
         if df.any(axis=None) and parse_dates:
             first_row = df.iloc[[0]]
             string_columns = first_row.dtypes[first_row.dtypes.apply(is_string_dtype)].index
             for column in string_columns:
-                for format, regex in DATETIME_FORMATS.items():
-                    if first_row[column].str.fullmatch(regex).all():
+                format = DATETIME_DIMENSIONS.get(column)
+                formats = [format] if format else DATETIME_FORMATS.keys()
+                for format in formats:
+                    if first_row[column].str.fullmatch(DATETIME_FORMATS[format]).all():
                         df[column] = pd.to_datetime(df[column], format=format)
                         break  # continue to next column
 
@@ -243,13 +269,5 @@ class GoogleAnalyticsAPI(object):
     def _parse_date(value):
         if is_dt(value):
             return as_day(value)
-        elif value in ['yesterday', 'today']:
-            return value
-        elif re.match(YYYY_MM_DD, value):
-            return value
-        elif re.match(r'\d+DaysAgo', value):
-            return value
         else:
-            raise ValueError(f'{value} is not a supported date.\n'
-                             f'Please use a date/datetime object or string of the following formats:\n'
-                             f'"yesterday", "today", "NDaysAgo", "YYYY-MM-DD"')
+            return _parse_date_str(value)
@@ -3,83 +3,121 @@ import datetime as dt
 import pandas as pd
 import pytest
 import intake
-from intake_google_analytics.source import GoogleAnalyticsAPI
+from intake_google_analytics.source import GoogleAnalyticsAPI, _parse_date_str
 from pandas.api.types import (is_datetime64_any_dtype, is_float_dtype,
                               is_integer_dtype)
 from pandas.testing import assert_frame_equal
 
+INTEGER_HEADER = {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users', 'type': 'INTEGER'}]}}
 
-def test_parse_fields_wrong_style():
-    with pytest.raises(ValueError):
-        GoogleAnalyticsAPI._parse_fields(['ga:users'], style='nope')
+
+def _assert_single_int_col(df, col, values):
+    assert list(df.columns) == [col]
+    assert is_integer_dtype(df[col])
+    assert df[col].tolist() == values
+
+
+class MockGAClient():
+    def __init__(self, credentials_path):
+        pass
+
+    def batchGet(self, body):
+        return MockGABatch(body)
+
+
+class MockGABatch():
+    def __init__(self, body):
+        self.body = body
+
+    def execute(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _patch_client(monkeypatch):
+    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
 
 
-def test_parse_metrics():
-    metrics = ['ga:users']
-    parsed = GoogleAnalyticsAPI._parse_fields(metrics, style='metrics')
-    assert parsed == [{'expression': 'ga:users'}]
+@pytest.fixture(scope='module')
+def ga_api():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
+        return GoogleAnalyticsAPI(None)
 
-    metrics = ['ga:users', 'ga:session']
-    parsed = GoogleAnalyticsAPI._parse_fields(metrics, style='metrics')
-    assert parsed == [{'expression': 'ga:users'}, {'expression': 'ga:session'}]
 
-    metrics = ['ga:users', {"expression": 'ga:session', 'alias': 'Session'}]
-    parsed = GoogleAnalyticsAPI._parse_fields(metrics, style='metrics')
-    assert parsed == [
-        {'expression': 'ga:users'},
-        {"expression": 'ga:session', 'alias': 'Session'}
-    ]
+@pytest.fixture
+def mock_batch(monkeypatch):
+    def _set(response):
+        monkeypatch.setattr(MockGABatch, 'execute', lambda self: response)
+    return _set
 
-    metrics = [{"expression": 'ga:session'}]
-    parsed = GoogleAnalyticsAPI._parse_fields(metrics, style='metrics')
-    assert parsed == metrics
 
-    metrics = [{"expression": 'ga:session', 'alias': 'Session'}]
-    parsed = GoogleAnalyticsAPI._parse_fields(metrics, style='metrics')
-    assert parsed == metrics
+def test_parse_fields_wrong_style():
+    with pytest.raises(ValueError, match='is not supported'):
+        GoogleAnalyticsAPI._parse_fields(['ga:users'], style='nope')
 
-    with pytest.raises(ValueError):
-        metrics = [{"espresso": 'ga:session', 'alias': 'Session'}]
-        GoogleAnalyticsAPI._parse_fields(metrics, style='metrics')
 
-    with pytest.raises(ValueError):
-        GoogleAnalyticsAPI._parse_fields([1], style='metrics')
+parse_fields_cases = [
+    ('metrics', ['ga:users'], [{'expression': 'ga:users'}]),
+    ('metrics', ['ga:users', 'ga:session'],
+     [{'expression': 'ga:users'}, {'expression': 'ga:session'}]),
+    ('metrics', ['ga:users', {"expression": 'ga:session', 'alias': 'Session'}],
+     [{'expression': 'ga:users'}, {"expression": 'ga:session', 'alias': 'Session'}]),
+    ('metrics', [{"expression": 'ga:session'}], [{"expression": 'ga:session'}]),
+    ('metrics', [{"expression": 'ga:session', 'alias': 'Session'}],
+     [{"expression": 'ga:session', 'alias': 'Session'}]),
+    ('dimensions', ['ga:userType'], [{'name': 'ga:userType'}]),
+    ('dimensions', ['ga:userType', 'ga:date'], [{'name': 'ga:userType'}, {'name': 'ga:date'}]),
+    ('dimensions', ['ga:userType', {'name': 'ga:date'}],
+     [{'name': 'ga:userType'}, {'name': 'ga:date'}]),
+    ('dimensions', [{'name': 'ga:date'}], [{'name': 'ga:date'}]),
+]
 
 
-def test_parse_dimensions():
-    dimensions = ['ga:userType']
-    parsed = GoogleAnalyticsAPI._parse_fields(dimensions, style='dimensions')
-    assert parsed == [{'name': 'ga:userType'}]
+@pytest.mark.parametrize('style,fields,expected', parse_fields_cases,
+                         ids=['metrics-str', 'metrics-strs', 'metrics-mixed', 'metrics-dict',
+                              'metrics-dict-alias', 'dimensions-str', 'dimensions-strs',
+                              'dimensions-mixed', 'dimensions-dict'])
+def test_parse_fields(style, fields, expected):
+    parsed = GoogleAnalyticsAPI._parse_fields(fields, style=style)
+    assert parsed == expected
 
-    dimensions = ['ga:userType', 'ga:date']
-    parsed = GoogleAnalyticsAPI._parse_fields(dimensions, style='dimensions')
-    assert parsed == [{'name': 'ga:userType'}, {'name': 'ga:date'}]
 
-    dimensions = ['ga:userType', {'name': 'ga:date'}]
-    parsed = GoogleAnalyticsAPI._parse_fields(dimensions, style='dimensions')
-    assert parsed == [{'name': 'ga:userType'}, {'name': 'ga:date'}]
+parse_fields_errors = (
+    ('metrics', ({"espresso": 'ga:session', 'alias': 'Session'},), 'does not contain "expression" key'),
+    ('metrics', (1,), 'is not a valid field'),
+    ('dimensions', ({"nom": 'ga:date'},), 'does not contain "name" key'),
+    ('dimensions', (1,), 'is not a valid field'),
+)
 
-    dimensions = [{'name': 'ga:date'}]
-    parsed = GoogleAnalyticsAPI._parse_fields(dimensions, style='dimensions')
-    assert parsed == dimensions
 
-    with pytest.raises(ValueError):
-        dimensions = [{"nom": 'ga:date'}]
-        GoogleAnalyticsAPI._parse_fields(dimensions, style='dimensions')
+@pytest.mark.parametrize('style,fields,match', parse_fields_errors,
+                         ids=['metrics-missing-key', 'metrics-int',
+                              'dimensions-missing-key', 'dimensions-int'])
+def test_parse_fields_invalid(style, fields, match):
+    with pytest.raises(ValueError, match=match):
+        GoogleAnalyticsAPI._parse_fields(fields, style=style)
+
+
+parse_date_objects = [
+    ('2020-03-19', '2020-03-19'),
+    (dt.date(2020, 3, 19), '2020-03-19'),
+    (dt.datetime(2020, 3, 19, 16, 20, 0), '2020-03-19'),
+    (pd.to_datetime('2020-03-19 16:20:00'), '2020-03-19'),
+    (pd.Timestamp(2020, 3, 19, 16, 20, 0), '2020-03-19'),
+]
 
-    with pytest.raises(ValueError):
-        GoogleAnalyticsAPI._parse_fields([1], style='dimensions')
 
+@pytest.mark.parametrize('value,expected', parse_date_objects,
+                         ids=['str', 'date', 'datetime', 'to_datetime', 'Timestamp'])
+def test_parse_date_objects(value, expected):
+    assert GoogleAnalyticsAPI._parse_date(value) == expected
 
-def test_parse_date_objects():
-    assert GoogleAnalyticsAPI._parse_date('2020-03-19') == '2020-03-19'
-    assert GoogleAnalyticsAPI._parse_date(dt.date(2020, 3, 19)) == '2020-03-19'
-    assert GoogleAnalyticsAPI._parse_date(dt.datetime(2020, 3, 19, 16, 20, 0)) == '2020-03-19'
-    assert GoogleAnalyticsAPI._parse_date(pd.to_datetime('2020-03-19 16:20:00')) == '2020-03-19'
-    assert GoogleAnalyticsAPI._parse_date(pd.Timestamp(2020, 3, 19, 16, 20, 0)) == '2020-03-19'
 
+@pytest.mark.parametrize('value', [dt.timedelta(days=2)], ids=['timedelta'])
+def test_parse_date_wrong_type(value):
     with pytest.raises(TypeError):
-        GoogleAnalyticsAPI._parse_date(dt.timedelta(days=2))
+        GoogleAnalyticsAPI._parse_date(value)
 
 
 def test_parse_date_strings():
@@ -87,16 +125,30 @@ def test_parse_date_strings():
     assert GoogleAnalyticsAPI._parse_date('today') == 'today'
     assert GoogleAnalyticsAPI._parse_date('1000DaysAgo') == '1000DaysAgo'
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match='tomorrow'):
         GoogleAnalyticsAPI._parse_date('tomorrow')
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match='πDaysAgo'):
         GoogleAnalyticsAPI._parse_date('πDaysAgo')
 
 
-def test_query_body(monkeypatch):
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: None)
+@pytest.mark.parametrize('value', ['Yesterday', 'TODAY', '5daysago', '5DaysAgoX', '2020-3-19'])
+def test_parse_date_strings_invalid(value):
+    with pytest.raises(ValueError, match='is not a supported date'):
+        GoogleAnalyticsAPI._parse_date(value)
 
+
+def test_parse_date_strings_cached():
+    _parse_date_str.cache_clear()
+    assert GoogleAnalyticsAPI._parse_date('5DaysAgo') == '5DaysAgo'
+    assert GoogleAnalyticsAPI._parse_date('5DaysAgo') == '5DaysAgo'
+
+    info = _parse_date_str.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_query_body(ga_api):
     inputs = {
         'view_id': 'VIEWID',
         'start_date': '5DaysAgo', 'end_date': 'yesterday',
@@ -111,14 +163,11 @@ def test_query_body(monkeypatch):
          'viewId': 'VIEWID'}
     ]}
 
-    client = GoogleAnalyticsAPI(None)
-    body = client._build_body(**inputs)
+    body = ga_api._build_body(**inputs)
     assert body == expected_body
 
 
-def test_query_body_with_dimensions(monkeypatch):
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: None)
-
+def test_query_body_with_dimensions(ga_api):
     inputs = {
         'view_id': 'VIEWID',
         'start_date': '5DaysAgo', 'end_date': 'yesterday',
@@ -135,44 +184,58 @@ def test_query_body_with_dimensions(monkeypatch):
          'viewId': 'VIEWID'}
     ]}
 
-    client = GoogleAnalyticsAPI(None)
-    body = client._build_body(**inputs)
+    body = ga_api._build_body(**inputs)
     assert body == expected_body
 
 
 def test_dataframe_empty_report():
     report = {
-        'columnHeader':
-            {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users', 'type': 'INTEGER'}]}},
-            'data': {}
+        'columnHeader': INTEGER_HEADER,
+        'data': {}
     }
     df = GoogleAnalyticsAPI._to_dataframe(report)
     assert df.empty
+    assert list(df.columns) == ['ga:users']
+    assert is_integer_dtype(df['ga:users'])
+
+
+def test_dataframe_single_metric():
+    report = {
+        'columnHeader': INTEGER_HEADER,
+        'data': {'rowCount': 1, 'rows': [{'metrics': [{'values': ['1']}]}]}
+    }
+    df = GoogleAnalyticsAPI._to_dataframe(report)
+    assert_frame_equal(df, pd.DataFrame([{'ga:users': 1}]))
 
 
-datetime_dimensions = [
+datetime_dimensions = (
     ('ga:yearMonth', '202003'),
     ('ga:date', '20200319'),
     ('ga:dateHour', '2020031916'),
     ('ga:dateHourMinute', '202003191620'),
-]
-
+)
+_DT_IDS = tuple(p[0] for p in datetime_dimensions)
 
-@pytest.mark.parametrize('dimension', datetime_dimensions, ids=[p[0] for p in datetime_dimensions])
-def test_dataframe_datetime_dimensions(dimension):
-    dim, value = dimension
 
-    report = {
+@pytest.fixture
+def dt_report(request):
+    dim, value = request.param
+    return {
         'columnHeader':
             {'dimensions': [dim],
-             'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users', 'type': 'INTEGER'}]}},
+             'metricHeader': INTEGER_HEADER['metricHeader']},
             'data': {
                 'rowCount': 1,
                 'rows': [{'dimensions': [value],
                           'metrics': [{'values': ['1']}]}]
             }
     }
-    df = GoogleAnalyticsAPI._to_dataframe(report)
+
+
+@pytest.mark.parametrize('dt_report', datetime_dimensions, indirect=True, ids=_DT_IDS)
+def test_dataframe_datetime_dimensions(dt_report):
+    dim = dt_report['columnHeader']['dimensions'][0]
+    df = GoogleAnalyticsAPI._to_dataframe(dt_report)
     assert is_datetime64_any_dtype(df[dim])
 
 
@@ -180,7 +243,7 @@ def test_dataframe_multiple_datetime_dimensions():
     multi_column = {
         'columnHeader':
             {'dimensions': ['ga:date', 'ga:dateHourMinute'],
-             'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users', 'type': 'INTEGER'}]}},
+             'metricHeader': INTEGER_HEADER['metricHeader']},
             'data': {
                 'rowCount': 1,
                 'rows': [{'dimensions': ['20200319', '202003191620'],
@@ -192,16 +255,72 @@ def test_dataframe_multiple_datetime_dimensions():
     assert is_datetime64_any_dtype(df['ga:date'])
 
 
-metric_dtypes = [
+def test_dataframe_repeated_datetime_dimension():
+    report = {
+        'columnHeader':
+            {'dimensions': ['ga:date', 'ga:userType'],
+             'metricHeader': INTEGER_HEADER['metricHeader']},
+            'data': {
+                'rowCount': 1000,
+                'rows': [{'dimensions': [f'2020031{i % 3}', 'New Visitor'],
+                          'metrics': [{'values': [str(i)]}]} for i in range(1000)]
+            }
+    }
+    df = GoogleAnalyticsAPI._to_dataframe(report)
+    assert is_datetime64_any_dtype(df['ga:date'])
+    assert df['ga:date'].nunique() == 3
+    assert not is_datetime64_any_dtype(df['ga:userType'])
+
+
+def test_dataframe_datetime_dimension_other_value():
+    report = {
+        'columnHeader':
+            {'dimensions': ['ga:date'],
+             'metricHeader': INTEGER_HEADER['metricHeader']},
+            'data': {
+                'rowCount': 2,
+                'rows': [{'dimensions': ['(other)'], 'metrics': [{'values': ['1']}]},
+                         {'dimensions': ['20200319'], 'metrics': [{'values': ['2']}]}]
+            }
+    }
+    df = GoogleAnalyticsAPI._to_dataframe(report)
+    assert not is_datetime64_any_dtype(df['ga:date'])
+    assert df['ga:date'].tolist() == ['(other)', '20200319']
+
+
+@pytest.mark.benchmark(group='to_dataframe')
+def test_to_dataframe_large(benchmark):
+    report = {
+        'columnHeader':
+            {'dimensions': ['ga:date', 'ga:userType'],
+             'metricHeader': {'metricHeaderEntries': [
+                 {'name': 'ga:users', 'type': 'INTEGER'},
+                 {'name': 'ga:sessionDuration', 'type': 'TIME'}]}},
+            'data': {
+                'rowCount': 10000,
+                'rows': [{'dimensions': [f'202003{i % 28 + 1:02d}', 'New Visitor'],
+                          'metrics': [{'values': [str(i), '1.5']}]} for i in range(10000)]
+            }
+    }
+    df = benchmark(GoogleAnalyticsAPI._to_dataframe, report)
+    assert len(df) == 10000
+    assert is_datetime64_any_dtype(df['ga:date'])
+    assert is_integer_dtype(df['ga:users'])
+    assert is_float_dtype(df['ga:sessionDuration'])
+    assert df['ga:users'].sum() == sum(range(10000))
+
+
+metric_dtypes = (
     ('INTEGER', "ga:users", '1', is_integer_dtype),
     ('TIME', 'ga:sessionDuration', '1.1', is_float_dtype),
     ('PERCENT', 'ga:percentNewSessions', '1.1', is_float_dtype),
     ('CURRENCY', 'ga:goalValueAll', '1.1', is_float_dtype),
     ('FLOAT', 'ga:pageviewsPerSession', '1.1', is_float_dtype)
-]
+)
+_METRIC_IDS = tuple(p[0] for p in metric_dtypes)
 
 
-@pytest.mark.parametrize('metric', metric_dtypes, ids=[p[0] for p in metric_dtypes])
+@pytest.mark.parametrize('metric', metric_dtypes, ids=_METRIC_IDS)
 def test_dataframe_metric_dtype(metric):
     ga_type, column, value, test_func = metric
 
@@ -218,58 +337,34 @@ def test_dataframe_metric_dtype(metric):
     assert test_func(df[column])
 
 
-class MockGAClient():
-    def __init__(self, credentials_path):
-        pass
-
-    def batchGet(self, body):
-        return MockGABatch(body)
-
-
-class MockGABatch():
-    def __init__(self, body):
-        self.body = body
-
-    def execute(self):
-        pass
-
-
-def test_query_to_dataframe(monkeypatch):
-    monkeypatch.setattr(MockGABatch, 'execute', lambda body: {
-            'reports': [
-                {'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                            'type': 'INTEGER'}]}},
-                 'data': {'rowCount': 1, 'rows': [{'metrics': [{'values': ['1']}]}]}}
-                ]
-            }
-    )
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
+def test_query_to_dataframe(mock_batch, ga_api):
+    mock_batch({
+        'reports': [
+            {'columnHeader': INTEGER_HEADER,
+             'data': {'rowCount': 1, 'rows': [{'metrics': [{'values': ['1']}]}]}}
+        ]
+    })
 
-    ga_api = GoogleAnalyticsAPI(None)
     df = ga_api.query(
         'VIEWID',
         start_date='5DaysAgo', end_date='yesterday',
         metrics=['ga:user']
     )
-    assert_frame_equal(df, pd.DataFrame([{'ga:users': 1}]), check_dtype=False)
-
-
-def test_query_wrong_row_count(monkeypatch):
-    monkeypatch.setattr(MockGABatch, 'execute', lambda body: {
-            'reports': [
-                {'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                            'type': 'INTEGER'}]}},
-                 'data': {'rowCount': 1, 'rows': [
-                     {'metrics': [{'values': ['1']}]},
-                     {'metrics': [{'values': ['2']}]}
-                     ]}}
-                ]
-            }
-    )
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
+    _assert_single_int_col(df, 'ga:users', [1])
+
 
-    ga_api = GoogleAnalyticsAPI(None)
-    with pytest.raises(RuntimeError):
+def test_query_wrong_row_count(mock_batch, ga_api):
+    mock_batch({
+        'reports': [
+            {'columnHeader': INTEGER_HEADER,
+             'data': {'rowCount': 1, 'rows': [
+                 {'metrics': [{'values': ['1']}]},
+                 {'metrics': [{'values': ['2']}]}
+                 ]}}
+        ]
+    })
+
+    with pytest.raises(RuntimeError, match='expected to return 1 rows'):
         _ = ga_api._query(
             'VIEWID',
             start_date='5DaysAgo', end_date='yesterday',
@@ -277,18 +372,14 @@ def test_query_wrong_row_count(monkeypatch):
         )
 
 
-def test_query_empty_result(monkeypatch):
-    monkeypatch.setattr(MockGABatch, 'execute', lambda body: {
-            'reports': [
-                {'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                            'type': 'INTEGER'}]}},
-                 'data': {}}
-                ]
-            }
-    )
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
+def test_query_empty_result(mock_batch, ga_api):
+    mock_batch({
+        'reports': [
+            {'columnHeader': INTEGER_HEADER,
+             'data': {}}
+        ]
+    })
 
-    ga_api = GoogleAnalyticsAPI(None)
     df = ga_api.query(
         'VIEWID',
         start_date='5DaysAgo', end_date='yesterday',
@@ -297,62 +388,57 @@ def test_query_empty_result(monkeypatch):
     assert df.empty
 
 
-def test_paginated_result(monkeypatch):
-    def execute(self):
-        paginated = [
-            {'reports': [
-                {'nextPageToken': 1,
-                'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                                            'type': 'INTEGER'}]}},
-                 'data': {'rowCount': 6, 'rows': [
-                     {'metrics': [{'values': ['1']}]}, {'metrics': [{'values': ['2']}]}
-                     ]}}
-                ]
-             },
-            {'reports': [
-                {'nextPageToken': 2,
-                'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                                            'type': 'INTEGER'}]}},
-                 'data': {'rowCount': 6, 'rows': [
-                     {'metrics': [{'values': ['3']}]}, {'metrics': [{'values': ['4']}]}
-                     ]}}
-                ]
-             },
-            {'reports': [
-                {'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                                            'type': 'INTEGER'}]}},
-                 'data': {'rowCount': 6, 'rows': [
-                     {'metrics': [{'values': ['5']}]}, {'metrics': [{'values': ['6']}]}
-                     ]}}
-                ]
-             },
+_PAGINATED_RESPONSES = [
+    {'reports': [
+        {'nextPageToken': 1,
+         'columnHeader': INTEGER_HEADER,
+         'data': {'rowCount': 6, 'rows': [
+             {'metrics': [{'values': ['1']}]}, {'metrics': [{'values': ['2']}]}
+             ]}}
         ]
+     },
+    {'reports': [
+        {'nextPageToken': 2,
+         'columnHeader': INTEGER_HEADER,
+         'data': {'rowCount': 6, 'rows': [
+             {'metrics': [{'values': ['3']}]}, {'metrics': [{'values': ['4']}]}
+             ]}}
+        ]
+     },
+    {'reports': [
+        {'columnHeader': INTEGER_HEADER,
+         'data': {'rowCount': 6, 'rows': [
+             {'metrics': [{'values': ['5']}]}, {'metrics': [{'values': ['6']}]}
+             ]}}
+        ]
+     },
+]
 
+
+def test_paginated_result(monkeypatch, ga_api):
+    def execute(self):
         page_token = self.body['reportRequests'][0].get('pageToken', 0)
-        return paginated[page_token]
+        return _PAGINATED_RESPONSES[page_token]
 
     monkeypatch.setattr(MockGABatch, 'execute', execute)
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
 
-    ga_api = GoogleAnalyticsAPI(None)
     df = ga_api.query(
         'VIEWID',
         start_date='5DaysAgo', end_date='yesterday',
         metrics=['ga:user']
     )
     assert len(df) == 6
+    assert df['ga:users'].tolist() == [1, 2, 3, 4, 5, 6]
+    assert len(_PAGINATED_RESPONSES[0]['reports'][0]['data']['rows']) == 2
 
 
-def test_load_dataset(monkeypatch):
-    monkeypatch.setattr(MockGABatch, 'execute', lambda body: {
-            'reports': [
-                {'columnHeader': {'metricHeader': {'metricHeaderEntries': [{'name': 'ga:users',
-                                                            'type': 'INTEGER'}]}},
-                 'data': {'rowCount': 1, 'rows': [{'metrics': [{'values': ['1']}]}]}}
-                ]
-            }
-    )
-    monkeypatch.setattr(GoogleAnalyticsAPI, 'create_client', lambda x: MockGAClient(x))
+def test_load_dataset(mock_batch):
+    mock_batch({
+        'reports': [
+            {'columnHeader': INTEGER_HEADER,
+             'data': {'rowCount': 1, 'rows': [{'metrics': [{'values': ['1']}]}]}}
+        ]
+    })
 
     ds = intake.open_google_analytics_query(
         'VIEWID',
@@ -381,4 +467,4 @@ def test_load_dataset(monkeypatch):
     assert ds.yaml() == yaml
 
     df = ds.read()
-    assert_frame_equal(df, pd.DataFrame([{'ga:users': 1}]), check_dtype=False)
+    _assert_single_int_col(df, 'ga:users', [1])